@@ -1,6 +1,9 @@
+import contextlib
+import os
 import streamlit as st
 import pandas as pd
 import numpy as np
+import pyarrow as pa
 import plotly.express as px
 import plotly.graph_objects as go
 
@@ -88,18 +91,70 @@ HK_BLUE = '#0079d3'
 HK_ORANGE = '#ff4500'
 GRAY = '#6e6e73'
 
-@st.cache_data
-def load_and_process_data():
-    """Loads, merges, and calculates key metrics for all datasets."""
+# Cache Limits (the follower slider alone yields a new cache key on every drag position)
+FILTER_CACHE_ENTRIES = 32
+FIGURE_CACHE_ENTRIES = 8
+
+def arrow_strings(df):
+    """Stores text columns as Arrow-backed strings, which sit in contiguous buffers rather than as Python objects."""
+    string_cols = df.select_dtypes(include=['object', 'string']).columns
+    df[string_cols] = df[string_cols].astype('string[pyarrow]')
+    return df
+
+def load_source(name):
+    """Reads `<name>.csv`, keeping a Parquet copy so later cold starts skip CSV parsing."""
+    csv_path, parquet_path = f'{name}.csv', f'{name}.parquet'
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path):
+        try:
+            return arrow_strings(pd.read_parquet(parquet_path, engine='pyarrow'))
+        except (OSError, pa.ArrowException):
+            pass  # An unreadable copy is rebuilt from the CSV below
+    
+    df = arrow_strings(pd.read_csv(csv_path, engine='pyarrow'))
+    # Write to a temp file and swap it in, so a failed write never leaves a truncated copy behind
+    tmp_path = f'{parquet_path}.{os.getpid()}.tmp'
+    try:
+        df.to_parquet(tmp_path, engine='pyarrow', index=False)
+        os.replace(tmp_path, parquet_path)
+    except (OSError, pa.ArrowException):
+        # Read-only deployments simply keep parsing the CSV
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+    return df
+
+def shrink_dtypes(df, ints=(), floats=(), categories=()):
+    """Downcasts integer columns to the smallest dtype that holds them, floats to float32, and labels to categoricals.
+
+    The float downcast is not lossless (pandas only checks values to within 5e-4), so keep money columns in float64.
+    """
+    df = df.copy()
+    if ints:
+        df[list(ints)] = df[list(ints)].apply(pd.to_numeric, downcast='integer')
+    if floats:
+        df[list(floats)] = df[list(floats)].apply(pd.to_numeric, downcast='float')
+    for col in categories:
+        df[col] = df[col].astype('category')
+    return df
+
+def merge_sources():
+    """Loads and merges all datasets into one post-level frame with engagement metrics. Returns None if a file is missing."""
+    # Intentionally uncached: load_agg() and load_posts() cache their own narrow outputs, so the wide
+    # merged frame is never pinned in memory. The cost is one extra read and merge on the content page's
+    # first visit; the missing-file st.error is the only side effect the two callers share.
     try:
         # Load data from the user-provided CSV files
-        df_influencers = pd.read_csv('influencers.csv')
-        df_posts = pd.read_csv('posts.csv')
-        df_tracking = pd.read_csv('tracking_data.csv')
-        df_payouts = pd.read_csv('payouts.csv')
+        df_influencers = load_source('influencers')
+        df_posts = load_source('posts')
+        df_tracking = load_source('tracking_data')
+        df_payouts = load_source('payouts')
     except FileNotFoundError as e:
         st.error(f"File not found: {e.filename}. Make sure all CSVs are in the same directory.", icon="🚨")
-        return None, None, None
+        return None
+
+    # Shrink dtypes so the merges, aggregations and filters move fewer bytes
+    df_influencers = shrink_dtypes(df_influencers, ints=['follower_count'], categories=['category'])
+    df_posts = shrink_dtypes(df_posts, ints=['reach', 'likes', 'comments'], categories=['platform'])
+    df_tracking = shrink_dtypes(df_tracking, ints=['orders', 'revenue'])
 
     # --- CORRECTION 1: Handle duplicate 'platform' column before merging ---
     # Merge posts with influencers, dropping the redundant platform column from influencers
@@ -115,58 +170,116 @@ def load_and_process_data():
         post_orders=('orders', 'sum'),
         post_revenue=('revenue', 'sum'),
         campaign=('campaign', 'first')  # Assume a post belongs to one primary campaign
-    ).reset_index()
+    )
     
-    df_merged = df_merged.merge(post_performance, left_on='post_id', right_on='source', how='left')
+    # 'source' is unique after the groupby, so join against it as the index
+    df_merged = df_merged.join(post_performance, on='post_id', how='left')
     df_merged[['post_orders', 'post_revenue']] = df_merged[['post_orders', 'post_revenue']].fillna(0)
+    df_merged = shrink_dtypes(df_merged, categories=['influencer_id', 'campaign'])
     
     # Calculate advanced metrics
-    df_merged['engagement_rate'] = ((df_merged['likes'] + df_merged['comments']) / df_merged['reach']).fillna(0)
-    df_merged['cpm'] = np.where(df_merged['reach'] > 0, (df_merged['total_payout'] / (df_merged['reach'] / 1000)), 0)
-    total_engagement = df_merged['likes'] + df_merged['comments']
-    df_merged['cpe'] = np.where(total_engagement > 0, df_merged['total_payout'] / total_engagement, 0)
+    # Work on the raw arrays so each metric is a single masked divide with no intermediate Series
+    likes, comments, reach, payout = df_merged[['likes', 'comments', 'reach', 'total_payout']].to_numpy(dtype=float).T
+    total_engagement = likes + comments
+    has_reach, has_engagement = reach > 0, total_engagement > 0
+    df_merged = df_merged.assign(
+        engagement_rate=np.divide(total_engagement, reach, out=np.zeros_like(reach), where=has_reach),
+        cpm=np.divide(payout * 1000, reach, out=np.zeros_like(reach), where=has_reach),
+        cpe=np.divide(payout, total_engagement, out=np.zeros_like(reach), where=has_engagement)
+    )
+    return df_merged
+
+@st.cache_data
+def load_agg():
+    """Builds the influencer and campaign rollups and the iROAS baseline. The merged post frame is not kept."""
+    df_merged = merge_sources()
+    if df_merged is None:
+        return None, None, None
     
     # --- Aggregate Data for Analysis ---
     
+    # Only these columns feed the rollups
+    df_agg_in = df_merged[[
+        'influencer_id', 'name', 'category', 'follower_count', 'platform', 'total_payout',
+        'post_revenue', 'post_orders', 'reach', 'likes', 'comments', 'engagement_rate', 'campaign'
+    ]]
+    
     # Influencer Level Aggregation (Now groups by the single 'platform' column)
-    influencer_agg = df_merged.groupby(['influencer_id', 'name', 'category', 'follower_count', 'platform', 'total_payout']).agg(
-        total_revenue=('post_revenue', 'sum'),
-        total_orders=('post_orders', 'sum'),
-        total_reach=('reach', 'sum'),
-        total_likes=('likes', 'sum'),
-        total_comments=('comments', 'sum'),
-        avg_engagement_rate=('engagement_rate', 'mean')
-    ).reset_index()
+    influencer_agg = aggregate_by(
+        df_agg_in, ['influencer_id', 'name', 'category', 'follower_count', 'platform', 'total_payout'],
+        sums={
+            'total_revenue': 'post_revenue',
+            'total_orders': 'post_orders',
+            'total_reach': 'reach',
+            'total_likes': 'likes',
+            'total_comments': 'comments'
+        },
+        means={'avg_engagement_rate': 'engagement_rate'}
+    )
     
     influencer_agg = calculate_metrics(influencer_agg, 'total_revenue', 'total_payout')
     
     # Campaign Level Aggregation
-    campaign_agg = df_merged.groupby('campaign').agg(
-        revenue=('post_revenue', 'sum'),
-        total_payout=('total_payout', 'sum'),
-        unique_influencers=('influencer_id', 'nunique')
-    ).reset_index()
+    campaign_agg = aggregate_by(
+        df_agg_in, ['campaign'],
+        sums={'revenue': 'post_revenue', 'total_payout': 'total_payout'}
+    )
     campaign_agg = calculate_metrics(campaign_agg, 'revenue', 'total_payout')
     
     # Calculate Baseline for iROAS
-    baseline_roas = campaign_agg['revenue'].sum() / campaign_agg['total_payout'].sum() if campaign_agg['total_payout'].sum() > 0 else 0
+    # Pooled ROAS across campaigns (total revenue / total payout)
+    campaign_revenue, campaign_payout = campaign_agg['revenue'].sum(), campaign_agg['total_payout'].sum()
+    baseline_roas = campaign_revenue / campaign_payout if campaign_payout > 0 else 0
     campaign_agg['iroas'] = campaign_agg['roas'] - baseline_roas
     influencer_agg['iroas'] = influencer_agg['roas'] - baseline_roas
 
-    return df_merged, influencer_agg, campaign_agg
+    return influencer_agg, campaign_agg, baseline_roas
+
+@st.cache_data
+def load_posts():
+    """Post-level frame for the content page, narrowed to the filter keys and displayed columns."""
+    df_merged = merge_sources()
+    if df_merged is None:
+        return None
+    return df_merged[[
+        'influencer_id', 'campaign', 'name', 'platform', 'caption',
+        'post_revenue', 'likes', 'engagement_rate'
+    ]]
 
 def calculate_metrics(df, revenue_col, payout_col):
     """Calculates ROI and ROAS on a dataframe."""
-    df['roas'] = np.where(df[payout_col] > 0, df[revenue_col] / df[payout_col], 0)
-    df['roi'] = np.where(df[payout_col] > 0, (df[revenue_col] - df[payout_col]) / df[payout_col], 0)
+    revenue = df[revenue_col].to_numpy(dtype=float)
+    payout = df[payout_col].to_numpy(dtype=float)
+    has_payout = payout > 0
+    # One masked divide for ROAS; ROI is derived as ROAS - 1 under the same mask
+    df['roas'] = np.divide(revenue, payout, out=np.zeros_like(payout), where=has_payout)
+    df['roi'] = np.subtract(df['roas'].to_numpy(), 1, out=np.zeros_like(payout), where=has_payout)
     return df
 
-# Load all data
-df_merged, df_influencer_agg, df_campaign_agg = load_and_process_data()
-if df_merged is None:
-    st.stop()
+def aggregate_by(df, keys, sums=None, means=None):
+    """Group-wise sums and means using one key factorization and np.bincount."""
+    sums, means = sums or {}, means or {}
+    df = df.dropna(subset=keys)
+    codes, groups = pd.MultiIndex.from_frame(df[keys]).factorize(sort=True)
+    n_groups = len(groups)
+    agg = groups.to_frame(index=False, name=keys).astype(df[keys].dtypes.to_dict())
     
-baseline_roas = df_campaign_agg['roas'].mean()
+    for name, col in sums.items():
+        values = df[col].to_numpy()
+        totals = np.bincount(codes, weights=np.nan_to_num(values.astype(float)), minlength=n_groups)
+        agg[name] = totals.astype(np.int64) if np.issubdtype(values.dtype, np.integer) else totals
+    for name, col in means.items():
+        values = df[col].to_numpy(dtype=float)
+        valid = ~np.isnan(values)
+        totals = np.bincount(codes[valid], weights=values[valid], minlength=n_groups)
+        counts = np.bincount(codes[valid], minlength=n_groups)
+        agg[name] = np.divide(totals, counts, out=np.full(n_groups, np.nan), where=counts > 0)
+    return agg
+
+# Load the rollups; post-level data is only loaded by the content page, via load_posts()
+df_influencer_agg, df_campaign_agg, baseline_roas = load_agg()
+if df_influencer_agg is None:
+    st.stop()
 
 # --- 4. SIDEBAR & FILTERS ---
 with st.sidebar:
@@ -180,17 +293,18 @@ with st.sidebar:
     st.header("Filters")
     
     # Ensure campaign list is not empty before passing to multiselect
-    campaign_options = df_campaign_agg['campaign'].dropna().unique()
+    campaign_options = tuple(df_campaign_agg['campaign'].dropna().unique())
     selected_campaigns = st.multiselect(
         "Campaigns", 
         options=campaign_options,
         default=campaign_options
     )
     
+    category_options = tuple(df_influencer_agg['category'].unique())
     selected_categories = st.multiselect(
         "Influencer Categories",
-        options=df_influencer_agg['category'].unique(),
-        default=df_influencer_agg['category'].unique()
+        options=category_options,
+        default=category_options
     )
     
     min_followers, max_followers = int(df_influencer_agg['follower_count'].min()), int(df_influencer_agg['follower_count'].max())
@@ -202,26 +316,139 @@ with st.sidebar:
     )
 
 # --- Filter Application ---
-filtered_influencers = df_influencer_agg[
-    (df_influencer_agg['category'].isin(selected_categories)) &
-    (df_influencer_agg['follower_count'].between(follower_range[0], follower_range[1]))
-]
+def category_lookup(categories, selected):
+    """Boolean table indexed by categorical code that is True for the selected labels."""
+    selected_codes = categories.get_indexer(list(selected))
+    # One extra trailing slot so missing values (code -1) always map to False
+    lookup = np.zeros(len(categories) + 1, dtype=bool)
+    lookup[selected_codes[selected_codes >= 0]] = True
+    return lookup
+
+def category_mask(values, selected):
+    """Membership mask for a categorical Series via a boolean lookup table indexed by its codes."""
+    return category_lookup(values.cat.categories, selected)[values.cat.codes.to_numpy()]
+
+def top_k_positions(values, k=5):
+    """Positions of the `k` largest non-NaN values, largest first; an O(N) partition in place of nlargest's full sort."""
+    valid = np.flatnonzero(~np.isnan(values))
+    values = values[valid]
+    if len(values) > k:
+        # Take everything above the k-th largest value, then fill up with its earliest ties like nlargest(keep='first')
+        kth = np.partition(values, -k)[-k]
+        above = np.flatnonzero(values > kth)
+        ties = np.flatnonzero(values == kth)[:k - len(above)]
+        top = np.sort(np.concatenate([above, ties]))
+    else:
+        top = np.arange(len(values))
+    # Stable sort on the ascending positions orders equal values by position, as nlargest does
+    return valid[top[np.argsort(-values[top], kind='stable')]]
+
+def top_k(df, col, k=5):
+    """Same rows and order as `df.dropna(subset=[col]).nlargest(k, col)`, using top_k_positions."""
+    return df.iloc[top_k_positions(df[col].to_numpy(), k)]
+
+@st.cache_resource
+def influencer_arrays(_df_influencer_agg):
+    """Contiguous NumPy copies of the influencer columns the filters and KPI totals read."""
+    arrays = {
+        'category_codes': np.array(_df_influencer_agg['category'].cat.codes.to_numpy(), order='C'),
+        'followers': np.array(_df_influencer_agg['follower_count'].to_numpy(), order='C'),
+        # Money totals are always accumulated in float64, whatever dtype the source column ended up with
+        'revenue': np.array(_df_influencer_agg['total_revenue'].to_numpy(), dtype=np.float64, order='C'),
+        'payout': np.array(_df_influencer_agg['total_payout'].to_numpy(), dtype=np.float64, order='C')
+    }
+    # Shared by every session, so make any accidental in-place write raise instead of corrupting the KPIs
+    for values in arrays.values():
+        values.flags.writeable = False
+    arrays['categories'] = _df_influencer_agg['category'].cat.categories
+    return arrays
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def influencer_mask(_df_influencer_agg, selected_categories, follower_range):
+    """Boolean mask over the influencer rows matching the category and follower filters. Cached on the selections only."""
+    arrays = influencer_arrays(_df_influencer_agg)
+    followers = arrays['followers']
+    return (
+        category_lookup(arrays['categories'], selected_categories)[arrays['category_codes']] &
+        (followers >= follower_range[0]) & (followers <= follower_range[1])
+    )
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def filter_influencers(_df_influencer_agg, selected_categories, follower_range):
+    """Influencer rows matching the category and follower filters. Cached on the selections only."""
+    return _df_influencer_agg[influencer_mask(_df_influencer_agg, selected_categories, follower_range)]
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def filter_campaigns(_df_campaign_agg, selected_campaigns):
+    """Campaign rows matching the campaign filter. Cached on the selections only."""
+    return _df_campaign_agg[category_mask(_df_campaign_agg['campaign'], selected_campaigns)]
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def post_mask(_df_posts, _df_influencer_agg, selected_campaigns, selected_categories, follower_range):
+    """Boolean mask over the post rows passing the filters. Cached on the selections only."""
+    influencer_ids = filter_influencers(_df_influencer_agg, selected_categories, follower_range)['influencer_id'].unique()
+    return (
+        category_mask(_df_posts['influencer_id'], influencer_ids) &
+        category_mask(_df_posts['campaign'], selected_campaigns)
+    )
 
-filtered_campaigns = df_campaign_agg[df_campaign_agg['campaign'].isin(selected_campaigns)]
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def top_filtered_posts(_df_posts, _df_influencer_agg, selected_campaigns, selected_categories, follower_range, sort_by, k=5):
+    """Top `k` posts by `sort_by` among those passing the filters."""
+    # The mask is memoized separately so switching the sort key does not rescan the posts
+    rows = np.flatnonzero(post_mask(_df_posts, _df_influencer_agg, selected_campaigns, selected_categories, follower_range))
+    return _df_posts.iloc[rows[top_k_positions(_df_posts[sort_by].to_numpy()[rows], k)]]
 
-filtered_posts = df_merged[
-    (df_merged['influencer_id'].isin(filtered_influencers['influencer_id'])) &
-    (df_merged['campaign'].isin(selected_campaigns))
-]
+# --- Cached Figures ---
+# Figures are shared across reruns and sessions via st.cache_resource, so callers must not mutate them
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def campaign_figures(_df_campaign_agg, selected_campaigns):
+    """Builds the campaign revenue vs. payout and iROAS charts. Cached on the selections only."""
+    filtered_campaigns = filter_campaigns(_df_campaign_agg, selected_campaigns)
+    
+    fig = go.Figure()
+    fig.add_trace(go.Bar(name='Revenue', x=filtered_campaigns['campaign'], y=filtered_campaigns['revenue'], marker_color=HK_BLUE))
+    fig.add_trace(go.Bar(name='Payout', x=filtered_campaigns['campaign'], y=filtered_campaigns['total_payout'], marker_color=HK_ORANGE))
+    fig.update_layout(title_text="Campaign Revenue vs. Payout", barmode='group', template='plotly_white', legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1))
+    
+    df_sorted_iroas = filtered_campaigns.sort_values(by='iroas', ascending=False)
+    colors = [HK_BLUE if x >= 0 else HK_ORANGE for x in df_sorted_iroas['iroas']]
+    fig_iroas = px.bar(df_sorted_iroas, x='campaign', y='iroas', title="iROAS by Campaign", text_auto='.2f')
+    fig_iroas.update_traces(marker_color=colors)
+    fig_iroas.update_layout(template='plotly_white', yaxis_title="iROAS Value", xaxis_title=None)
+    fig_iroas.add_hline(y=0, line_dash="dot", line_color=GRAY)
+    return fig, fig_iroas
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def influencer_scatter(_df_influencer_agg, selected_categories, follower_range):
+    """Builds the ROAS vs. follower count bubble chart. Cached on the selections only."""
+    return px.scatter(
+        filter_influencers(_df_influencer_agg, selected_categories, follower_range), x='follower_count', y='roas',
+        size='total_revenue', color='category', hover_name='name',
+        title='ROAS vs. Follower Count (Bubble Size = Revenue)',
+        labels={'follower_count': 'Follower Count', 'roas': 'Return on Ad Spend (ROAS)'},
+        template='plotly_white'
+    )
+
+# Filters are passed to the cached helpers as hashable tuples
+campaign_filter = tuple(sorted(selected_campaigns))
+category_filter = tuple(sorted(selected_categories))
+follower_filter = tuple(follower_range)
 
 # --- 5. PAGE DEFINITIONS ---
 
 def render_overview_page():
     st.title("🏠 Executive Overview")
     st.markdown("A high-level summary of influencer marketing performance based on selected filters.")
+    filtered_influencers = filter_influencers(df_influencer_agg, category_filter, follower_filter)
+    filtered_campaigns = filter_campaigns(df_campaign_agg, campaign_filter)
 
-    total_revenue = filtered_influencers['total_revenue'].sum()
-    total_payout = filtered_influencers['total_payout'].sum()
+    # KPI totals reduce the pre-extracted arrays directly instead of going through the filtered frame
+    arrays = influencer_arrays(df_influencer_agg)
+    mask = influencer_mask(df_influencer_agg, category_filter, follower_filter)
+    total_revenue = arrays['revenue'][mask].sum()
+    total_payout = arrays['payout'][mask].sum()
     roas = total_revenue / total_payout if total_payout > 0 else 0
     roi = (total_revenue - total_payout) / total_payout if total_payout > 0 else 0
     
@@ -236,7 +463,7 @@ def render_overview_page():
     col1, col2 = st.columns(2)
     with col1:
         st.subheader("Top 5 Campaigns by ROAS")
-        st.dataframe(filtered_campaigns.nlargest(5, 'roas')[['campaign', 'revenue', 'roas']], 
+        st.dataframe(top_k(filtered_campaigns, 'roas')[['campaign', 'revenue', 'roas']], 
                      use_container_width=True, hide_index=True,
                      column_config={
                          "campaign": "Campaign",
@@ -245,7 +472,7 @@ def render_overview_page():
                      })
     with col2:
         st.subheader("Top 5 Influencers by Revenue")
-        st.dataframe(filtered_influencers.nlargest(5, 'total_revenue')[['name', 'total_revenue', 'roas']], 
+        st.dataframe(top_k(filtered_influencers, 'total_revenue')[['name', 'total_revenue', 'roas']], 
                      use_container_width=True, hide_index=True,
                      column_config={
                          "name": "Influencer",
@@ -258,34 +485,20 @@ def render_campaign_analysis_page():
     st.markdown("Deep dive into the performance of individual campaigns.")
     
     st.header("Campaign Financials")
-    fig = go.Figure()
-    fig.add_trace(go.Bar(name='Revenue', x=filtered_campaigns['campaign'], y=filtered_campaigns['revenue'], marker_color=HK_BLUE))
-    fig.add_trace(go.Bar(name='Payout', x=filtered_campaigns['campaign'], y=filtered_campaigns['total_payout'], marker_color=HK_ORANGE))
-    fig.update_layout(title_text="Campaign Revenue vs. Payout", barmode='group', template='plotly_white', legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1))
+    fig, fig_iroas = campaign_figures(df_campaign_agg, campaign_filter)
     st.plotly_chart(fig, use_container_width=True)
     
     st.header("Incremental ROAS (iROAS)")
     st.info(f"iROAS measures performance against the baseline ROAS of **{baseline_roas:.2f}x**. A positive value indicates above-average performance.", icon="💡")
-    df_sorted_iroas = filtered_campaigns.sort_values(by='iroas', ascending=False)
-    colors = [HK_BLUE if x >= 0 else HK_ORANGE for x in df_sorted_iroas['iroas']]
-    fig_iroas = px.bar(df_sorted_iroas, x='campaign', y='iroas', title="iROAS by Campaign", text_auto='.2f')
-    fig_iroas.update_traces(marker_color=colors)
-    fig_iroas.update_layout(template='plotly_white', yaxis_title="iROAS Value", xaxis_title=None)
-    fig_iroas.add_hline(y=0, line_dash="dot", line_color=GRAY)
     st.plotly_chart(fig_iroas, use_container_width=True)
 
 def render_influencer_analysis_page():
     st.title("✨ Influencer Analysis")
     st.markdown("Evaluate individual influencer effectiveness and identify top performers.")
+    filtered_influencers = filter_influencers(df_influencer_agg, category_filter, follower_filter)
     
     st.header("ROAS vs. Follower Count")
-    fig = px.scatter(
-        filtered_influencers, x='follower_count', y='roas',
-        size='total_revenue', color='category', hover_name='name',
-        title='ROAS vs. Follower Count (Bubble Size = Revenue)',
-        labels={'follower_count': 'Follower Count', 'roas': 'Return on Ad Spend (ROAS)'},
-        template='plotly_white'
-    )
+    fig = influencer_scatter(df_influencer_agg, category_filter, follower_filter)
     st.plotly_chart(fig, use_container_width=True)
     
     st.header("Influencer Performance Metrics")
@@ -302,24 +515,29 @@ def render_content_page():
     st.title("📝 Content & Engagement Analysis")
     st.markdown("Analyze which posts and captions drive the best results.")
     
+    df_posts = load_posts()
+    if df_posts is None:
+        st.stop()
+    
     sort_by = st.selectbox("Sort Top Posts By:", ['post_revenue', 'likes', 'engagement_rate'])
     
-    top_posts = filtered_posts.nlargest(5, sort_by)
+    top_posts = top_filtered_posts(
+        df_posts, df_influencer_agg, campaign_filter, category_filter, follower_filter, sort_by
+    )[['name', 'platform', 'caption', 'post_revenue', 'engagement_rate', 'likes']]
     
-    for _, row in top_posts.iterrows():
-        st.subheader(f"{row['name']} on {row['platform']}")
-        col1, col2 = st.columns([3, 1])
-        with col1:
-            st.markdown(f"*{row['caption']}*")
-        with col2:
-            st.metric("Post Revenue", f"₹{row['post_revenue']:,.0f}")
-            st.metric("Engagement Rate", f"{row['engagement_rate']:.2%}")
-            st.metric("Likes", f"{row['likes']:,}")
-        st.markdown("---")
+    # Engagement is stored as a fraction; scale it so the column can use a printf-style percent format
+    top_posts = top_posts.assign(engagement_rate=top_posts['engagement_rate'] * 100)
+    st.dataframe(top_posts, use_container_width=True, hide_index=True, column_config={
+        "name": "Influencer", "platform": "Platform", "caption": "Caption",
+        "post_revenue": st.column_config.NumberColumn("Post Revenue", format="₹%.0f"),
+        "engagement_rate": st.column_config.NumberColumn("Engagement Rate", format="%.2f%%"),
+        "likes": st.column_config.NumberColumn("Likes", format="%d")
+    })
 
 def render_financials_page():
     st.title("💰 Financials & Performance Review")
     st.markdown("Analyze payout structures and identify underperforming assets.")
+    filtered_influencers = filter_influencers(df_influencer_agg, category_filter, follower_filter)
     
     st.header("Payout Details")
     payouts_to_show = filtered_influencers[['name', 'total_payout']].drop_duplicates()